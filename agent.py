@@ -1,94 +1,426 @@
 import os
+import json
+import base64
+import codecs
+import hashlib
+import shelve
 import yaml
-import requests
+import aiohttp
+import asyncio
 import re
+import time
 import logging
+import functools
+from contextlib import asynccontextmanager
+from urllib.parse import quote
+
+try:
+    import ahocorasick
+except ImportError:  # Optional; determine_project_for_pr falls back to a substring scan.
+    ahocorasick = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # Optional; the standard library parser handles the same bytes, just slower.
+    _loads = json.loads
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 
+# Patterns used on every PR and file, compiled once.
+_TITLE_RE = re.compile(r"([\w\-]+)[\s:]+")
+_BODY_NAME_RE = re.compile(r"project\s*name\s*[:\-]\s*([\w\-]+)", re.IGNORECASE)
+_NONWORD_RE = re.compile(r"\W+")
+
+
+@functools.lru_cache(maxsize=128)
+def _project_pattern(project_name):
+    # Case-insensitive literal matcher for a project name, reused across PRs and files.
+    return re.compile(re.escape(project_name), re.IGNORECASE)
+
+
+def _contains_ci(needle_re, haystack):
+    # Case-insensitive containment test that scans in C without building a lowercased copy.
+    return needle_re.search(haystack) is not None
+
+
+_PROMPT_PREAMBLE = (
+    "You are a project health evaluation expert. Analyze the following "
+    "project reports to determine the overall health of the project. Retain all important attributes such as maintenance history, contributor activity, trends, and risks.\n\n"
+    "Below are the reports:\n\n"
+)
+_PROMPT_SUFFIX = "Please summarize your evaluation and provide actionable recommendations."
+
+# Characters that make up a markdown table separator row such as "|---|:---:|".
+_TABLE_SEPARATOR_CHARS = frozenset("|-: \t")
+
+
+def _iter_schedule_projects(content):
+    # Single pass over a markdown document, yielding the "project" column of the first table that has one.
+    project_idx = None
+    num_cols = 0
+    for line in content.splitlines():
+        if "|" not in line:
+            continue
+        if project_idx is None:
+            header_cols = [col.strip().lower() for col in line.strip("|").split("|")]
+            if "project" in header_cols:
+                project_idx = header_cols.index("project")
+                num_cols = len(header_cols)
+            continue
+        if set(line) <= _TABLE_SEPARATOR_CHARS:
+            continue
+        cols = line.strip("|").split("|", num_cols)
+        if len(cols) != num_cols:
+            continue
+        project_name = cols[project_idx].strip()
+        if project_name.replace("-", "").strip():
+            yield project_name.lower()
+
+
+class LocalRepoMirror:
+    def __init__(self, repo_owner, repo_name, github_token, mirror_dir):
+        self.clone_url = f"https://github.com/{repo_owner}/{repo_name}.git"
+        self.mirror_dir = mirror_dir
+        # Pass the token to git through its environment-based config, so it is neither written to the mirror's
+        # git config nor visible on the command line (ps, /proc/*/cmdline).
+        credentials = base64.b64encode(f"x-access-token:{github_token}".encode()).decode()
+        self._git_env = {
+            **os.environ,
+            "GIT_CONFIG_COUNT": "1",
+            "GIT_CONFIG_KEY_0": "http.extraHeader",
+            "GIT_CONFIG_VALUE_0": f"Authorization: Basic {credentials}",
+        }
+        self.ready = False
+
+    async def _git(self, *args):
+        process = await asyncio.create_subprocess_exec(
+            "git", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=self._git_env,
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed: {stderr.decode().strip()}")
+
+    async def sync(self):
+        # Shallow-clone once, then only fetch the latest commit on later runs.
+        try:
+            if os.path.isdir(os.path.join(self.mirror_dir, ".git")):
+                logging.info(f"Refreshing local repository mirror in '{self.mirror_dir}'.")
+                await self._git("-C", self.mirror_dir, "fetch", "--depth=1", "origin")
+                await self._git("-C", self.mirror_dir, "reset", "--hard", "origin/HEAD")
+            else:
+                logging.info(f"Cloning {self.clone_url} into '{self.mirror_dir}'.")
+                await self._git("clone", "--depth=1", "--filter=blob:none", self.clone_url, self.mirror_dir)
+            self.ready = True
+        except (OSError, RuntimeError) as e:
+            logging.warning(f"Failed to mirror repository locally, falling back to the GitHub API: {e}")
+            self.ready = False
+        return self.ready
+
+    def local_path(self, path):
+        return os.path.join(self.mirror_dir, *path.split("/"))
+
+    def list_files(self, path=""):
+        logging.info(f"Listing local mirror files recursively in path '{path}'.")
+        files = []
+        for root, dirs, filenames in os.walk(self.local_path(path)):
+            dirs[:] = [d for d in dirs if d != ".git"]
+            for name in filenames:
+                local_path = os.path.join(root, name)
+                repo_path = os.path.relpath(local_path, self.mirror_dir).replace(os.sep, "/")
+                files.append({"type": "file", "name": name, "path": repo_path, "local_path": local_path})
+        logging.info(f"Total files found in '{path}': {len(files)}")
+        return files
+
 
 class GitHubClient:
-    def __init__(self, repo_owner, repo_name, github_token):
+    # Start waiting for the rate-limit window to reset once fewer calls than this remain.
+    RATE_LIMIT_FLOOR = 10
+    MAX_RETRIES = 5
+
+    def __init__(self, repo_owner, repo_name, github_token, max_concurrency=20, etag_cache_file="etag_cache.json",
+                 mirror=None, private=False):
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.github_token = github_token
+        # Public repositories serve raw file content without credentials.
+        self.private = private
+        # Optional LocalRepoMirror; when synced, repository files are read from disk instead of the API.
+        self.mirror = mirror
+        # Repository listings by path; the tree does not change during a run, so all PRs share one lookup.
+        self._file_list_cache = {}
+        # Pooled aiohttp.ClientSessions opened by AIAgent.run for the lifetime of the run: the authenticated
+        # one for api.github.com, and one for raw file downloads, which do not count against the API rate limit.
+        self.api_session = None
+        self.raw_session = None
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._rate_limit_reset = 0.0
+        self.etag_cache_file = etag_cache_file
+        self._etag_cache = self._load_etag_cache()
+        self._etag_cache_dirty = False
+
+    def _load_etag_cache(self):
+        if not os.path.exists(self.etag_cache_file):
+            return {}
+        try:
+            with open(self.etag_cache_file, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable ETag cache '{self.etag_cache_file}': {e}")
+            return {}
+
+    def save_etag_cache(self):
+        if self._etag_cache_dirty:
+            with open(self.etag_cache_file, "w") as f:
+                json.dump(self._etag_cache, f)
+            self._etag_cache_dirty = False
+            logging.info(f"Saved {len(self._etag_cache)} ETag cache entries to '{self.etag_cache_file}'.")
+        elif os.path.exists(self.etag_cache_file):
+            # Nothing changed upstream; just mark the cache as fresh.
+            os.utime(self.etag_cache_file)
+
+    @asynccontextmanager
+    async def _request(self, url, headers=None, raw=False):
+        # Every GitHub call goes through here so that concurrency stays bounded and rate limits are honoured.
+        session = self.raw_session if raw else self.api_session
+        for attempt in range(self.MAX_RETRIES + 1):
+            if not raw:
+                await self._wait_for_rate_limit()
+            async with self._sem:
+                response = await session.get(url, headers=headers)
+                if not raw:
+                    self._track_rate_limit(response.headers)
+                delay = self._retry_delay(response, attempt)
+                if delay is None or attempt == self.MAX_RETRIES:
+                    try:
+                        yield response
+                    finally:
+                        response.release()
+                    return
+                response.release()
+            logging.warning(f"Rate limited by GitHub on {url}; retrying in {delay:.0f}s.")
+            await asyncio.sleep(delay)
+
+    def _track_rate_limit(self, headers):
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset is not None and int(remaining) < self.RATE_LIMIT_FLOOR:
+            self._rate_limit_reset = max(self._rate_limit_reset, float(reset))
+
+    async def _wait_for_rate_limit(self):
+        delay = self._rate_limit_reset - time.time()
+        if delay > 0:
+            logging.warning(f"GitHub rate limit nearly exhausted; sleeping {delay:.0f}s until reset.")
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, response, attempt):
+        # Returns how long to back off before retrying, or None if the response should be used as is.
+        if response.status not in (403, 429):
+            return None
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            return float(retry_after)
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            return max(float(response.headers.get("X-RateLimit-Reset", 0)) - time.time(), 1.0)
+        if response.status == 429:
+            return float(2 ** attempt)
+        return None
 
-    def get_open_pull_requests(self):
+    async def _get_json(self, url, conditional=True):
+        # Replay the cached ETag so unchanged resources come back as a 304 that costs no rate limit.
+        cached = self._etag_cache.get(url) if conditional else None
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+        async with self._request(url, headers=headers) as response:
+            if response.status != 304:
+                response.raise_for_status()
+                body = _loads(await response.read())
+                etag = response.headers.get("ETag")
+                if etag:
+                    self._etag_cache[url] = {"etag": etag, "body": body}
+                    self._etag_cache_dirty = True
+                return body
+        if cached and "body" in cached:
+            logging.info(f"Not modified, using cached response for {url}")
+            return cached["body"]
+        logging.warning(f"Received 304 for {url} without a cached body; refetching unconditionally.")
+        return await self._get_json(url, conditional=False)
+
+    async def get_open_pull_requests(self):
         logging.info("Fetching open pull requests.")
         url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/pulls"
-        headers = {"Authorization": f"token {self.github_token}"}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        prs = response.json()
+        prs = await self._get_json(url)
         logging.info(f"Found {len(prs)} open pull request(s).")
         return prs
 
-    def list_repo_files(self, path=""):
+    async def list_repo_files(self, path=""):
+        task = self._file_list_cache.get(path)
+        if task is None:
+            # Cache the in-flight task so concurrent callers wait on the same listing.
+            task = self._file_list_cache[path] = asyncio.ensure_future(self._list_repo_files(path))
+        try:
+            return await task
+        except Exception:
+            self._file_list_cache.pop(path, None)
+            raise
+
+    async def _list_repo_files(self, path):
+        if self.mirror is not None and self.mirror.ready:
+            return self.mirror.list_files(path)
+        files = await self.get_repo_tree()
+        if files is None:
+            return await self._list_repo_files_via_contents(path)
+        if path:
+            prefix = path.rstrip("/") + "/"
+            files = [f for f in files if f["path"].startswith(prefix)]
+        logging.info(f"Total files found in '{path}': {len(files)}")
+        return files
+
+    async def get_repo_tree(self, ref="HEAD"):
+        # The Git Trees API returns every file of a commit in one call; returns None if GitHub truncated it.
+        logging.info(f"Fetching recursive repository tree for '{ref}'.")
+        base_url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}"
+        commit = await self._get_json(f"{base_url}/commits/{ref}")
+        tree = await self._get_json(f"{base_url}/git/trees/{commit['commit']['tree']['sha']}?recursive=1")
+        if tree.get("truncated"):
+            logging.warning("Repository tree is truncated; falling back to listing directory contents.")
+            return None
+        raw_base_url = f"https://raw.githubusercontent.com/{self.repo_owner}/{self.repo_name}/{commit['sha']}"
+        return [
+            {
+                "type": "file",
+                "name": entry["path"].rsplit("/", 1)[-1],
+                "path": entry["path"],
+                "download_url": f"{raw_base_url}/{quote(entry['path'])}",
+            }
+            for entry in tree["tree"]
+            if entry["type"] == "blob"
+        ]
+
+    async def _list_repo_files_via_contents(self, path=""):
         logging.info(f"Listing repository files recursively in path '{path}'.")
-        files = []
         url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/contents/{path}"
-        headers = {"Authorization": f"token {self.github_token}"}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        items = response.json()
-        for item in items:
-            if item["type"] == "file":
-                files.append(item)
-            elif item["type"] == "dir":
-                # Recursively list files in subfolders.
-                sub_files = self.list_repo_files(item["path"])
-                files.extend(sub_files)
+        items = await self._get_json(url)
+        files = [item for item in items if item["type"] == "file"]
+        # Recursively list all subfolders of this level in parallel.
+        sub_listings = await asyncio.gather(
+            *[self._list_repo_files_via_contents(item["path"]) for item in items if item["type"] == "dir"]
+        )
+        for sub_files in sub_listings:
+            files.extend(sub_files)
         logging.info(f"Total files found in '{path}': {len(files)}")
         return files
 
-    def get_file_content(self, file_info):
+    async def iter_file_content(self, file_info, chunk_size=64 * 1024):
+        # Yields the file as decoded text chunks so callers can scan it without buffering the raw body too.
+        local_path = file_info.get("local_path")
+        if local_path:
+            logging.info(f"Reading content for file from local mirror: {file_info.get('path')}")
+            with open(local_path, "r", encoding="utf-8", errors="replace") as f:
+                for chunk in iter(lambda: f.read(chunk_size), ""):
+                    yield chunk
+            return
         # Prefer "raw_url" if available; otherwise, use "download_url".
         download_url = file_info.get("raw_url") or file_info.get("download_url")
         if not download_url:
             logging.warning(f"No URL found for file: {file_info.get('filename') or file_info.get('name')}")
-            return ""
+            return
         logging.info(f"Downloading content for file: {file_info.get('filename') or file_info.get('name')}")
-        response = requests.get(download_url)
-        response.raise_for_status()
-        return response.text
-
-    def get_file_by_path(self, path):
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        headers = {"Authorization": f"token {self.github_token}"} if self.private else None
+        async with self._request(download_url, headers=headers, raw=True) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(chunk_size):
+                yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+
+    async def get_file_content(self, file_info):
+        return "".join([chunk async for chunk in self.iter_file_content(file_info)])
+
+    async def get_file_by_path(self, path):
+        if self.mirror is not None and self.mirror.ready and os.path.isfile(self.mirror.local_path(path)):
+            return {"type": "file", "name": path.rsplit("/", 1)[-1], "path": path,
+                    "local_path": self.mirror.local_path(path)}
         logging.info(f"Fetching file by path: {path}")
         url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/contents/{path}"
-        headers = {"Authorization": f"token {self.github_token}"}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url)
 
-    def get_pr_files(self, pr_number):
+    async def get_pr_files(self, pr_number):
         logging.info(f"Fetching files for PR #{pr_number}")
         url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}/files"
-        headers = {"Authorization": f"token {self.github_token}"}
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        files = response.json()
+        files = await self._get_json(url)
         logging.info(f"Found {len(files)} file(s) in PR #{pr_number}.")
         return files
 
 
 class AnalysisEngine:
-    def __init__(self, llm_server_url, model):
+    # Bump whenever the way responses are read or post-processed changes, so stale cache entries are not reused.
+    CACHE_FORMAT_VERSION = 2
+
+    def __init__(self, llm_server_url, model, max_concurrency=8, cache_file=None):
         self.llm_server_url = llm_server_url.rstrip('/')
         self.model = model
+        # Pooled aiohttp.ClientSession for the LLM server, opened by AIAgent.run for the lifetime of the run.
+        self.session = None
+        self._sem = asyncio.Semaphore(max_concurrency)
+        # Responses by payload hash, so a report shared by several PRs is only generated once. The optional
+        # shelve file keeps them across runs as well.
+        self._response_cache = {}
+        self.cache_file = cache_file
+        self._disk_cache = None
+
+    @classmethod
+    def _cache_key(cls, payload):
+        # Hash the whole payload so any change to model, prompt or generation options misses the cache.
+        serialized = json.dumps(payload, sort_keys=True)
+        return hashlib.blake2b(f"{cls.CACHE_FORMAT_VERSION}\0{serialized}".encode(), digest_size=16).hexdigest()
+
+    def _cached_response(self, cache_key):
+        if cache_key in self._response_cache:
+            return self._response_cache[cache_key]
+        if self.cache_file and self._disk_cache is None:
+            self._disk_cache = shelve.open(self.cache_file)
+        if self._disk_cache is not None and cache_key in self._disk_cache:
+            self._response_cache[cache_key] = self._disk_cache[cache_key]
+            return self._response_cache[cache_key]
+        return None
+
+    def _store_response(self, cache_key, result):
+        self._response_cache[cache_key] = result
+        if self._disk_cache is not None:
+            self._disk_cache[cache_key] = result
+
+    def close_cache(self):
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+
+    async def _generate(self, payload):
+        cache_key = self._cache_key(payload)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            logging.info("Reusing cached LLM response for identical prompt.")
+            return cached
+        url = f"{self.llm_server_url}/api/generate"
+        async with self._sem:
+            async with self.session.post(url, json=payload) as response:
+                response.raise_for_status()
+                body = _loads(await response.read())
+        result = body.get("response", "").strip()
+        self._store_response(cache_key, result)
+        return result
 
     def construct_prompt(self, reports):
-        prompt = (
-            "You are a project health evaluation expert. Analyze the following "
-            "project reports to determine the overall health of the project. Retain all important attributes such as maintenance history, contributor activity, trends, and risks.\n\n"
-            "Below are the reports:\n\n"
-        )
-        for idx, report in enumerate(reports, 1):
-            prompt += f"Report {idx}:\n{report}\n\n"
-        prompt += "Please summarize your evaluation and provide actionable recommendations."
+        parts = [_PROMPT_PREAMBLE]
+        parts.extend(f"Report {idx}:\n{report}\n\n" for idx, report in enumerate(reports, 1))
+        parts.append(_PROMPT_SUFFIX)
+        prompt = "".join(parts)
         logging.info("Constructed detailed final prompt for LLM.")
         return prompt
 
-    def analyze_reports(self, reports):
+    async def analyze_reports(self, reports):
         # Use the aggregated individual analyses to create a final summary.
         aggregated = "\n\n".join(reports)
         final_prompt = (
@@ -105,14 +437,11 @@ class AnalysisEngine:
             "stream": False
         }
         logging.info("Sending aggregated prompt to Ollama LLM API for final summary.")
-        url = f"{self.llm_server_url}/api/generate"
-        logging.info(f"Constructed URL for final analysis: {url}")
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
+        summary = await self._generate(payload)
         logging.info("Received final summary from LLM.")
-        return response.json().get("response", "").strip()
+        return summary
 
-    def analyze_single_report(self, report, index):
+    async def analyze_single_report(self, report, index):
         # For each report (file content) ask the LLM to provide a detailed analysis including its chain-of-thought.
         prompt = (
             f"Analyze the following report (file {index}) and provide your thinking process step by step. "
@@ -129,25 +458,40 @@ class AnalysisEngine:
             "stop": ["\n"],
             "stream": False
         }
-        url = f"{self.llm_server_url}/api/generate"
         logging.info(f"Sending single report payload to LLM API for file {index}: {payload}")
-        response = requests.post(url, json=payload)
-        response.raise_for_status()
-        thought = response.json().get("response", "").strip()
+        thought = await self._generate(payload)
         logging.info(f"Received analysis for file {index}:\n{thought}")
         return thought
 
 
 class ReportExtractor:
+    def __init__(self):
+        # Aho-Corasick automaton over the candidate projects, rebuilt only when the candidates change.
+        self._automaton = None
+        self._automaton_projects = None
+
+    def _project_automaton(self, candidate_projects):
+        if ahocorasick is None or not candidate_projects:
+            return None
+        projects = tuple(candidate_projects)
+        if projects != self._automaton_projects:
+            automaton = ahocorasick.Automaton()
+            for project in projects:
+                automaton.add_word(project, project)
+            automaton.make_automaton()
+            self._automaton = automaton
+            self._automaton_projects = projects
+        return self._automaton
+
     def extract_project_name_from_pr(self, pr, llm_engine=None):
         title = pr.get("title", "")
-        match = re.match(r"([\w\-]+)[\s:]+", title)
+        match = _TITLE_RE.match(title)
         candidate = match.group(1) if match else None
         if candidate and candidate.lower() != "create":
             logging.info(f"Extracted project name '{candidate}' from PR title.")
             return candidate
         body = pr.get("body", "")
-        match_body = re.search(r"project\s*name\s*[:\-]\s*([\w\-]+)", body, re.IGNORECASE)
+        match_body = _BODY_NAME_RE.search(body)
         candidate_body = match_body.group(1) if match_body else None
         if candidate_body and candidate_body.lower() != "create":
             logging.info(f"Extracted project name '{candidate_body}' from PR body.")
@@ -158,45 +502,25 @@ class ReportExtractor:
         logging.warning("Failed to extract project name from PR using heuristics.")
         return None
 
-    def list_possible_projects(self, github_client):
+    async def list_possible_projects(self, github_client):
         try:
-            file_info = github_client.get_file_by_path("tac/project-updates/2025/2025-schedule.md")
-            content = github_client.get_file_content(file_info)
-            projects = set()
+            file_info = await github_client.get_file_by_path("tac/project-updates/2025/2025-schedule.md")
+            content = await github_client.get_file_content(file_info)
             if "Project" in content and "|" in content:
-                lines = content.splitlines()
-                header_found = False
-                header_cols = []
-                for line in lines:
-                    if not header_found and '|' in line:
-                        header_cols = [col.strip().lower() for col in line.strip("|").split("|")]
-                        if "project" in header_cols:
-                            header_found = True
-                        continue
-                    if header_found:
-                        if re.match(r"^\s*[-|]+\s*$", line):
-                            continue
-                        if '|' in line:
-                            cols = [col.strip() for col in line.strip("|").split("|")]
-                            if header_cols and len(cols) == len(header_cols):
-                                idx = header_cols.index("project")
-                                project_name = cols[idx].strip()
-                                if project_name and not re.match(r'^[\-\s]+$', project_name):
-                                    projects.add(project_name.lower())
-                project_list = list(projects)
+                project_list = list(set(_iter_schedule_projects(content)))
                 logging.info(f"Projects extracted from schedule table: {project_list}")
                 return project_list
             else:
                 raise ValueError("Schedule file does not appear to contain a markdown table.")
         except Exception as e:
             logging.warning(f"Failed to extract projects from schedule file: {e}")
-            files = github_client.list_repo_files()
+            files = await github_client.list_repo_files()
             candidate_projects = set()
             for file_info in files:
                 if file_info["type"] != "file":
                     continue
                 name = file_info.get("name", "")
-                tokens = re.split(r'\W+', name)
+                tokens = _NONWORD_RE.split(name)
                 for token in tokens:
                     if token and len(token) > 2:
                         candidate_projects.add(token.lower())
@@ -207,39 +531,68 @@ class ReportExtractor:
     def determine_project_for_pr(self, pr, candidate_projects, github_client, llm_engine=None):
         pr_text = f"{pr.get('title', '')} {pr.get('body', '')} {pr.get('description', '')}".lower()
         logging.info("Attempting to correlate PR with known project names.")
-        for project in candidate_projects:
-            if project in pr_text:
+        automaton = self._project_automaton(candidate_projects)
+        if automaton is not None:
+            # Single pass over the PR text regardless of how many candidate projects there are.
+            for _, project in automaton.iter(pr_text):
                 logging.info(f"Determined project '{project}' from PR text correlation.")
                 return project
+        else:
+            for project in candidate_projects:
+                if project in pr_text:
+                    logging.info(f"Determined project '{project}' from PR text correlation.")
+                    return project
         logging.warning("Unable to determine project from PR text correlation.")
         return None
 
     def filter_reports(self, files, project_name):
         if not project_name:
             return []
-        project_pattern = re.compile(re.escape(project_name), re.IGNORECASE)
-        filtered = [f for f in files if f["type"] == "file" and project_pattern.search(f["name"])]
+        # The project name is a literal, so a lowercase substring test matches the same files as a regex.
+        needle = project_name.lower()
+        filtered = [f for f in files if f["type"] == "file" and needle in f["name"].lower()]
         logging.info(f"Filtered {len(filtered)} files matching project '{project_name}'.")
         return filtered
 
-    def extract_reports_from_repo(self, github_client, project_name):
-        files = github_client.list_repo_files()
+    async def extract_reports_from_repo(self, github_client, project_name):
+        files = await github_client.list_repo_files()
         matching_files = self.filter_reports(files, project_name)
+        contents = await asyncio.gather(
+            *[self._read_if_mentions(github_client, file_info, project_name) for file_info in matching_files]
+        )
         reports = []
-        for file_info in matching_files:
-            content = github_client.get_file_content(file_info)
-            if project_name.lower() in content.lower():
+        for file_info, content in zip(matching_files, contents):
+            if content is not None:
                 reports.append(content)
                 logging.info(f"Added report from file '{file_info.get('name')}'.")
         return reports
 
-    def extract_reports_from_pr(self, pr, github_client):
+    async def _read_if_mentions(self, github_client, file_info, project_name):
+        # Returns the file content if it mentions the project, else None. The mention check runs per chunk
+        # (plus a small overlap for matches spanning chunks) with a memoized case-insensitive regex.
+        project_re = _project_pattern(project_name)
+        overlap = len(project_name) - 1
+        parts = []
+        tail = ""
+        found = False
+        async for chunk in github_client.iter_file_content(file_info):
+            parts.append(chunk)
+            if not found:
+                window = tail + chunk
+                found = _contains_ci(project_re, window)
+                tail = window[-overlap:] if overlap else ""
+        return "".join(parts) if found else None
+
+    async def extract_reports_from_pr(self, pr, github_client):
         reports = []
         if "number" in pr:
-            pr_files = github_client.get_pr_files(pr["number"])
+            pr_files = await github_client.get_pr_files(pr["number"])
             for file_info in pr_files:
                 logging.info(f"Extracting report from PR files '{file_info}'.")
-                content = github_client.get_file_content(file_info)
+            contents = await asyncio.gather(
+                *[github_client.get_file_content(file_info) for file_info in pr_files]
+            )
+            for content in contents:
                 if content:
                     reports.append(content)
             if reports:
@@ -254,14 +607,53 @@ class ReportExtractor:
 
 
 class ResultManager:
-    def __init__(self, output_file):
+    def __init__(self, output_file, per_project=False):
         self.output_file = output_file
+        # With per_project, each project writes to its own file so concurrent PRs do not overwrite each other.
+        self.per_project = per_project
+        # Project whose header each output file currently holds, so append_step knows when to start fresh.
+        self._initialized = {}
+        # Per output file: steps that finished ahead of an earlier step, and the next step index to write.
+        self._pending_steps = {}
+        self._next_step = {}
+
+    def output_path(self, project):
+        if not self.per_project:
+            return self.output_file
+        root, ext = os.path.splitext(self.output_file)
+        return f"{root}-{_NONWORD_RE.sub('-', project).strip('-')}{ext}"
 
     def write_output(self, project, content):
         # Override the output file with the new contents (chain-of-thought update)
-        with open(self.output_file, "w") as f:
+        output_file = self.output_path(project)
+        with open(output_file, "w") as f:
             f.write(f"{project}:\n\n{content}\n")
-        logging.info(f"Overwritten results for project '{project}' in '{self.output_file}'.")
+        self._initialized.pop(output_file, None)
+        self._pending_steps.pop(output_file, None)
+        self._next_step.pop(output_file, None)
+        logging.info(f"Overwritten results for project '{project}' in '{output_file}'.")
+
+    def append_step(self, project, index, step_text):
+        # Write only new steps instead of rewriting all previous ones; step 1 starts a fresh file. Steps that
+        # finish early are held back so the file always lists them in index order.
+        output_file = self.output_path(project)
+        if self._initialized.get(output_file) != project:
+            self._initialized[output_file] = project
+            self._pending_steps[output_file] = {}
+            self._next_step[output_file] = 1
+        pending = self._pending_steps[output_file]
+        pending[index] = step_text
+        while self._next_step[output_file] in pending:
+            next_index = self._next_step[output_file]
+            text = pending.pop(next_index)
+            if next_index == 1:
+                with open(output_file, "w") as f:
+                    f.write(f"{project}:\n\n{text}\n")
+            else:
+                with open(output_file, "a") as f:
+                    f.write(f"\n{text}\n")
+            self._next_step[output_file] = next_index + 1
+            logging.info(f"Appended analysis step {next_index} for project '{project}' to '{output_file}'.")
 
 
 class AIAgent:
@@ -270,55 +662,130 @@ class AIAgent:
         github_token = os.getenv("GITHUB_TOKEN")
         if not github_token:
             raise ValueError("GITHUB_TOKEN environment variable is not set.")
+        mirror_dir = config["github"].get("mirror_dir", "repo_mirror")
+        mirror = LocalRepoMirror(
+            config["github"]["repo_owner"],
+            config["github"]["repo_name"],
+            github_token,
+            mirror_dir
+        ) if mirror_dir else None
         self.github_client = GitHubClient(
             config["github"]["repo_owner"],
             config["github"]["repo_name"],
-            github_token
+            github_token,
+            config["github"].get("max_concurrency", 20),
+            config["github"].get("etag_cache_file", "etag_cache.json"),
+            mirror,
+            config["github"].get("private", False)
         )
         self.analysis_engine = AnalysisEngine(
             config["llm"]["server_url"],
-            config["llm"]["model"]
+            config["llm"]["model"],
+            config["llm"].get("max_concurrency", 8),
+            config["llm"].get("cache_file", ".llm_cache")
         )
         self.report_extractor = ReportExtractor()
-        self.result_manager = ResultManager(config["output"]["result_file"])
+        self.result_manager = ResultManager(
+            config["output"]["result_file"],
+            config["output"].get("per_project_files", False)
+        )
+        self._pr_sem = asyncio.Semaphore(config["github"].get("pr_concurrency", 4))
+
+    async def analyze_step(self, report, idx):
+        thought = await self.analysis_engine.analyze_single_report(report, idx)
+        return f"Step {idx} Analysis:\n{thought}"
 
-    def process_pull_request(self, pr, candidate_projects):
+    async def analyze_pull_request(self, pr, candidate_projects):
         project = self.report_extractor.determine_project_for_pr(
             pr, candidate_projects, self.github_client, self.analysis_engine
         )
         if not project:
             logging.error("Skipping PR; unable to determine project.")
-            return
+            return None
 
         # Extract reports from PR and repository
         reports = []
-        reports.extend(self.report_extractor.extract_reports_from_pr(pr, self.github_client))
-        reports.extend(self.report_extractor.extract_reports_from_repo(self.github_client, project))
-
-        if reports:
-            # Iteratively analyze each report file
-            analysis_steps = []
-            for idx, report in enumerate(reports, 1):
-                step = self.analysis_engine.analyze_single_report(report, idx)
-                analysis_steps.append(f"Step {idx} Analysis:\n{step}")
-                # Write each step to the output file
-                self.result_manager.write_output(project, "\n\n".join(analysis_steps))
-            # Obtain final summary based on individual analysis steps
-            final_summary = self.analysis_engine.analyze_reports(analysis_steps)
-            self.result_manager.write_output(project, f"Final Summary:\n{final_summary}")
-            logging.info(f"Final results for project '{project}' processed.")
-        else:
-            logging.warning(f"No reports found for project '{project}'.")
+        pr_reports, repo_reports = await asyncio.gather(
+            self.report_extractor.extract_reports_from_pr(pr, self.github_client),
+            self.report_extractor.extract_reports_from_repo(self.github_client, project),
+        )
+        reports.extend(pr_reports)
+        reports.extend(repo_reports)
 
-    def run(self):
-        candidate_projects = self.report_extractor.list_possible_projects(self.github_client)
-        pull_requests = self.github_client.get_open_pull_requests()
-        if not pull_requests:
-            logging.info("No open pull requests found.")
-            return
+        if not reports:
+            logging.warning(f"No reports found for project '{project}'.")
+            return None
 
-        for pr in pull_requests:
-            self.process_pull_request(pr, candidate_projects)
+        # Reports are independent, so analyze them all concurrently
+        analysis_steps = await asyncio.gather(
+            *[self.analyze_step(report, idx) for idx, report in enumerate(reports, 1)]
+        )
+        # Obtain final summary based on individual analysis steps
+        final_summary = await self.analysis_engine.analyze_reports(analysis_steps)
+        return project, analysis_steps, final_summary
+
+    def write_results(self, project, analysis_steps, final_summary):
+        for idx, step in enumerate(analysis_steps, 1):
+            self.result_manager.append_step(project, idx, step)
+        self.result_manager.write_output(project, f"Final Summary:\n{final_summary}")
+        logging.info(f"Final results for project '{project}' processed.")
+
+    async def process_pull_request(self, pr, candidate_projects):
+        result = await self.analyze_pull_request(pr, candidate_projects)
+        if result:
+            self.write_results(*result)
+
+    async def _process_pull_request_in_turn(self, pr, candidate_projects, previous_written, written):
+        try:
+            async with self._pr_sem:
+                result = await self.analyze_pull_request(pr, candidate_projects)
+            # Only the writes wait for earlier PRs, so the output files end up as a sequential run leaves them.
+            await previous_written.wait()
+            if result:
+                self.write_results(*result)
+        finally:
+            written.set()
+
+    async def process_pull_requests(self, pull_requests, candidate_projects):
+        # PRs are analyzed concurrently; each one's results are written after those of the PR before it.
+        written = [asyncio.Event() for _ in pull_requests]
+        previous_written = asyncio.Event()
+        previous_written.set()
+        tasks = []
+        for pr, pr_written in zip(pull_requests, written):
+            tasks.append(self._process_pull_request_in_turn(pr, candidate_projects, previous_written, pr_written))
+            previous_written = pr_written
+        await asyncio.gather(*tasks)
+
+    async def run(self):
+        headers = {"Authorization": f"token {self.github_client.github_token}"}
+        # Pooled sessions for the whole run so every call reuses kept-alive TLS connections to its host.
+        api_connector = aiohttp.TCPConnector(limit=50, limit_per_host=20, keepalive_timeout=60)
+        raw_connector = aiohttp.TCPConnector(limit=50, limit_per_host=20, keepalive_timeout=60)
+        # The LLM gets its own session so the GitHub token is never sent to it; generation may take a while.
+        llm_connector = aiohttp.TCPConnector(limit=50, keepalive_timeout=60)
+        llm_timeout = aiohttp.ClientTimeout(total=None)
+        async with aiohttp.ClientSession(headers=headers, connector=api_connector) as api_session, \
+                aiohttp.ClientSession(connector=raw_connector) as raw_session, \
+                aiohttp.ClientSession(connector=llm_connector, timeout=llm_timeout) as llm_session:
+            self.github_client.api_session = api_session
+            self.github_client.raw_session = raw_session
+            self.analysis_engine.session = llm_session
+            if self.github_client.mirror is not None:
+                await self.github_client.mirror.sync()
+            try:
+                candidate_projects, pull_requests = await asyncio.gather(
+                    self.report_extractor.list_possible_projects(self.github_client),
+                    self.github_client.get_open_pull_requests(),
+                )
+                if not pull_requests:
+                    logging.info("No open pull requests found.")
+                    return
+
+                await self.process_pull_requests(pull_requests, candidate_projects)
+            finally:
+                self.github_client.save_etag_cache()
+                self.analysis_engine.close_cache()
 
 
 def load_config(config_path="agent_config.yaml"):
@@ -327,7 +794,12 @@ def load_config(config_path="agent_config.yaml"):
         return yaml.safe_load(file)
 
 
-if __name__ == "__main__":
+async def main():
     config = load_config()
+    # Build the agent inside the running loop so its asyncio primitives are bound to it.
     agent = AIAgent(config)
-    agent.run()
+    await agent.run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())